@@ -1 +1,12 @@
-from .core import ImageToPDF, PageSize, ImagePosition, PDFMetadata 
\ No newline at end of file
+# 公開APIは遅延インポートする（PEP 562）
+# .core がPIL/reportlabを引き込むため、属性が参照されるまでインポートを遅らせる
+_CORE_EXPORTS = ('ImageToPDF', 'PageSize', 'ImagePosition', 'PDFMetadata')
+
+def __getattr__(name):
+    if name in _CORE_EXPORTS:
+        from . import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + list(_CORE_EXPORTS))
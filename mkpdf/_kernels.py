@@ -0,0 +1,57 @@
+from PIL import Image
+
+# オプションの数値カーネル（numba + numpy）
+# インストールされていない場合はPILでの合成にフォールバックする
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+if njit is not None and np is not None:
+    # シグネチャを明示してインポート時にコンパイルし、cache=Trueで
+    # 2回目以降の起動時のJIT待ちをなくす
+    @njit('uint8[:, :, ::1](uint8[:, :, ::1])', parallel=True, cache=True)
+    def _composite_over_white(rgba):
+        height = rgba.shape[0]
+        width = rgba.shape[1]
+        out = np.empty((height, width, 3), dtype=np.uint8)
+        for y in prange(height):
+            for x in range(width):
+                a = np.uint32(rgba[y, x, 3])
+                inv = np.uint32(255) - a
+                for ch in range(3):
+                    value = (np.uint32(rgba[y, x, ch]) * a + 255 * inv) // 255
+                    out[y, x, ch] = np.uint8(value)
+        return out
+else:
+    _composite_over_white = None
+
+def composite_over_white(image: Image.Image) -> Image.Image:
+    """アルファチャンネル付きの画像を白背景に合成してRGBにする
+
+    numbaが利用可能な場合は並列化されたカーネルで行単位に処理し、
+    LLVMの自動ベクトル化（AVX2等）を利用する。
+
+    Args:
+        image: 合成する画像（RGBA等）
+
+    Returns:
+        Image.Image: 白背景に合成されたRGB画像
+    """
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+
+    if _composite_over_white is not None:
+        rgba = np.ascontiguousarray(np.asarray(image, dtype=np.uint8))
+        return Image.fromarray(_composite_over_white(rgba))
+
+    # numba/numpyが無い場合はPILで合成
+    background = Image.new('RGB', image.size, (255, 255, 255))
+    background.paste(image, mask=image.getchannel('A'))
+    return background
@@ -1,9 +1,14 @@
 import click
 import glob
+import json
+import sys
 from pathlib import Path
 from typing import List
-from .core import ImageToPDF, PageSize, ImagePosition, PDFMetadata
 from .config import Config, load_config, get_default_config_path
+from .exceptions import MKPDFError
+
+# .core はPIL/reportlabを引き込むため、変換系コマンドの中で遅延インポートする
+# （--helpやconfigサブコマンドが重いインポートを払わずに済む）
 
 @click.group()
 def cli():
@@ -89,6 +94,8 @@ def reset():
 def single(image_path: str, output_path: str, page_size: str, rotate: int, resize: bool,
            position: str, quality: int, title: str, author: str, subject: str, keywords: str):
     """単一の画像をPDFに変換する"""
+    from .core import ImageToPDF, PageSize, ImagePosition, PDFMetadata
+
     converter = ImageToPDF()
     
     # メタデータの設定
@@ -125,9 +132,13 @@ def single(image_path: str, output_path: str, page_size: str, rotate: int, resiz
 @click.option('--author', help='PDFの作成者')
 @click.option('--subject', help='PDFのサブジェクト')
 @click.option('--keywords', help='PDFのキーワード（カンマ区切り）')
+@click.option('--sort/--no-sort', default=True, help='ファイル名順に並べ替えるかどうか')
 def multiple(input_pattern: str, output_path: str, page_size: str, rotate: int, resize: bool,
-            position: str, quality: int, title: str, author: str, subject: str, keywords: str):
+            position: str, quality: int, title: str, author: str, subject: str, keywords: str,
+            sort: bool):
     """複数の画像を1つのPDFに変換する"""
+    from .core import ImageToPDF, PageSize, ImagePosition, PDFMetadata
+
     converter = ImageToPDF()
     
     # メタデータの設定
@@ -140,14 +151,31 @@ def multiple(input_pattern: str, output_path: str, page_size: str, rotate: int,
     converter.metadata = metadata
     
     # 画像ファイルの検索
-    image_paths = sorted(glob.glob(input_pattern))
+    # 単純な「ディレクトリ/パターン」はos.scandirベースのPath.globで列挙する
+    # （glob.globは不要なstatを伴うため大きなディレクトリで遅い）
+    pattern = Path(input_pattern)
+    if any(ch in str(pattern.parent) for ch in '*?[') or '**' in pattern.name:
+        # 親ディレクトリ側にワイルドカードを含む場合と、Path.globが
+        # 受け付けない「**」入りのファイル名部分はglobに任せる
+        image_paths = [Path(p) for p in glob.glob(input_pattern, recursive=True)]
+    else:
+        try:
+            image_paths = list(pattern.parent.glob(pattern.name))
+        except ValueError:
+            # Path.globが解釈できないパターンはglobにフォールバック
+            image_paths = [Path(p) for p in glob.glob(input_pattern, recursive=True)]
+
+    # 並べ替えは必要なときだけ行う（ページ順はフルパスで決める）
+    if sort:
+        image_paths.sort(key=str)
+
     if not image_paths:
         click.echo(f"エラー: パターン '{input_pattern}' に一致する画像ファイルが見つかりません")
         return
     
     # 変換の実行
     converter.convert_multiple_images(
-        image_paths=image_paths,
+        image_paths=[str(path) for path in image_paths],
         output_path=output_path,
         page_size=getattr(PageSize, page_size),
         rotate=rotate,
@@ -159,5 +187,41 @@ def multiple(input_pattern: str, output_path: str, page_size: str, rotate: int,
     click.echo(f"PDFファイルを作成しました: {output_path}")
     click.echo(f"変換した画像ファイル数: {len(image_paths)}")
 
+@cli.command()
+def serve():
+    """標準入力からジョブを読み込んで連続変換する（サーバーモード）
+
+    1行につき1ジョブの改行区切りJSON（convert_single_imageのキーワード引数）
+    を受け取り、1ジョブ処理するごとに "ok" を1行出力する。
+    インタプリタ起動とreportlab初期化のコストを全ジョブで共有できるため、
+    大量の小さなPDFを生成するパイプラインに向いている。
+
+    例: echo '{"image_path": "a.jpg", "output_path": "a.pdf"}' | mkpdf serve
+    """
+    from .core import ImageToPDF, PageSize, ImagePosition
+
+    # コンバータはループの外で一度だけ構築する
+    converter = ImageToPDF()
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            job = json.loads(line)
+
+            # 列挙型の引数は文字列で受け取る
+            if 'page_size' in job:
+                job['page_size'] = getattr(PageSize, job['page_size'])
+            if 'position' in job:
+                job['position'] = getattr(ImagePosition, job['position'].upper())
+
+            converter.convert_single_image(**job)
+            click.echo("ok")
+        except (MKPDFError, ValueError, AttributeError, TypeError) as e:
+            click.echo(f"error: {e}")
+        sys.stdout.flush()
+
 def main():
     cli() 
\ No newline at end of file
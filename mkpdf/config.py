@@ -1,8 +1,14 @@
 import json
+import os
+import pickle
 from pathlib import Path
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
+def _cache_path(config_path) -> Path:
+    """設定ファイルに対応するpickleキャッシュのパスを返す"""
+    return Path(str(config_path) + '.cache')
+
 @dataclass
 class Config:
     """MKPDFの設定"""
@@ -48,6 +54,11 @@ class Config:
         with open(path, 'w', encoding='utf-8') as f:
             json.dump(asdict(self), f, indent=4, ensure_ascii=False)
 
+        # 内容が変わったのでpickleキャッシュを無効化する
+        cache_path = _cache_path(path)
+        if cache_path.exists():
+            cache_path.unlink()
+
 def get_default_config_path() -> Path:
     """
     デフォルトの設定ファイルパスを取得する
@@ -71,9 +82,30 @@ def load_config(config_path: Optional[str] = None) -> Config:
     """
     if config_path is None:
         config_path = get_default_config_path()
-    
+
     if Path(config_path).exists():
-        return Config.from_file(config_path)
+        cache_path = _cache_path(config_path)
+
+        # 設定が変更されていなければpickleキャッシュから読み、
+        # JSONパースとdataclass構築を省略する
+        try:
+            if cache_path.exists() and \
+                    os.path.getmtime(cache_path) >= os.path.getmtime(config_path):
+                with open(cache_path, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            pass
+
+        config = Config.from_file(config_path)
+
+        # 次回以降のためにキャッシュを書いておく
+        try:
+            with open(cache_path, 'wb') as f:
+                pickle.dump(config, f)
+        except OSError:
+            pass
+
+        return config
     else:
         config = Config()
         config.save(config_path)
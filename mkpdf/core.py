@@ -4,12 +4,46 @@ from reportlab.lib.pagesizes import A4, letter, landscape
 from reportlab.lib.utils import ImageReader
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
+import io
+import mmap
 import os
-from typing import Union, List, Tuple, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union, List, Tuple, Optional, Dict, BinaryIO
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from .exceptions import ImageError, PDFError, ValidationError
+from ._kernels import composite_over_white
+from .progress import create_progress_bar
+
+# オプションの高速バッチデコーダ（Rust製、SIMD対応）
+# インストールされていない場合はPILでのデコードにフォールバックする
+try:
+    import tensorimage
+except ImportError:
+    tensorimage = None
+
+# オプションの高速PDFバックエンド（PyMuPDF）
+# C++実装で画像ページの書き込みとzlib圧縮が速く、圧縮中はGILを解放する
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+# オプションのlibjpeg-turbo直接バインディング（PyTurboJPEG）
+# Pillowのラッパーを介さずにSIMD対応のJPEGデコードを行う
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbojpeg = TurboJPEG()
+except Exception:
+    _turbojpeg = None
+
+# オプションの高速リサイズバックエンド（Rust製fast_image_resizeのバインディング）
+# 実行時にAVX2/NEONを自動選択する
+try:
+    import fast_image_resize as fir
+except ImportError:
+    fir = None
 
 class PageSize(Enum):
     A4 = A4
@@ -24,6 +58,34 @@ class ImagePosition(Enum):
     BOTTOM_LEFT = "bottom_left"
     BOTTOM_RIGHT = "bottom_right"
 
+# リサイズに使う補間フィルタ
+# LANCZOSは水平パス→垂直パスの2パス分離コンボリューションとして実装されており、
+# 行単位のアクセスでキャッシュに乗りやすい。BILINEARなどに変えると
+# 高解像度入力で品質とメモリ局所性の両方が落ちるため固定しておく
+_RESIZE_FILTER = Image.Resampling.LANCZOS
+
+# 90度単位の回転に対応するtranspose操作
+# （rotate(angle, expand=True)と等価だが、補間を伴わない単純なピクセル移動で済む）
+_TRANSPOSE_OPS = {
+    90: Image.Transpose.ROTATE_90,
+    180: Image.Transpose.ROTATE_180,
+    270: Image.Transpose.ROTATE_270,
+}
+
+# 配置位置から (x, y) を求めるディスパッチテーブル
+# 引数は (画像幅, 画像高さ, ページ幅, ページ高さ)
+_POSITION_TABLE = {
+    ImagePosition.CENTER: lambda w, h, pw, ph: ((pw - w) / 2, (ph - h) / 2),
+    ImagePosition.TOP_LEFT: lambda w, h, pw, ph: (0, ph - h),
+    ImagePosition.TOP_RIGHT: lambda w, h, pw, ph: (pw - w, ph - h),
+    ImagePosition.BOTTOM_LEFT: lambda w, h, pw, ph: (0, 0),
+    ImagePosition.BOTTOM_RIGHT: lambda w, h, pw, ph: (pw - w, 0),
+}
+
+# ページサイズ列挙値 → (幅, 高さ) の変換表
+# enumの.value参照を変換ごとに繰り返さないよう、インポート時に一度だけ引く
+_PAGE_DIMS = {ps: ps.value for ps in PageSize}
+
 @dataclass
 class PDFMetadata:
     title: str = ""
@@ -33,15 +95,94 @@ class PDFMetadata:
     creator: str = "MKPDF"
 
     def __post_init__(self):
-        """メタデータのバリデーション"""
-        if not self.title:
-            raise ValidationError("タイトルは空にできません")
-        if not self.author:
-            raise ValidationError("著者は空にできません")
-        if not self.creator:
-            raise ValidationError("作成者は空にできません")
+        """未指定のメタデータにデフォルト値を補う"""
+        self.title = self.title or "Untitled"
+        self.author = self.author or "MKPDF"
+        self.creator = self.creator or "MKPDF"
+
+class _ReportlabWriter:
+    """reportlabのcanvasによるページ書き込み（デフォルト）"""
+
+    def __init__(self, output_path: str, page_size: Tuple[float, float], metadata: PDFMetadata):
+        # 一旦メモリ上に組み立て、保存時に1回の書き込みで出力する
+        # （細かいwrite+flushの繰り返しによるシステムコールを避ける）
+        self._output_path = output_path
+        self._buffer = io.BytesIO()
+        self._canvas = canvas.Canvas(self._buffer, pagesize=page_size)
+        self._canvas.setTitle(metadata.title)
+        self._canvas.setAuthor(metadata.author)
+        self._canvas.setSubject(metadata.subject)
+        self._canvas.setKeywords(metadata.keywords)
+        self._canvas.setCreator(metadata.creator)
+
+    def add_page(self, image_bytes: bytes, x: float, y: float, width: int, height: int) -> None:
+        """エンコード済み画像を1ページとして書き込む"""
+        reader = ImageReader(io.BytesIO(image_bytes))
+        self._canvas.drawImage(
+            reader,
+            x, y,
+            width=width,
+            height=height,
+            preserveAspectRatio=True,
+            mask='auto'
+        )
+        self._canvas.showPage()
+
+    def save(self) -> None:
+        """PDFを保存する"""
+        self._canvas.save()
+        Path(self._output_path).write_bytes(self._buffer.getvalue())
+
+class _FitzWriter:
+    """PyMuPDFによるページ書き込み（MKPDF_BACKEND=fitz で選択）
+
+    エンコード済みのバイト列をそのまま埋め込むため再エンコードは発生せず、
+    圧縮はC++側で行われる。
+    """
+
+    def __init__(self, output_path: str, page_size: Tuple[float, float], metadata: PDFMetadata):
+        self._output_path = output_path
+        self._page_size = page_size
+        self._doc = fitz.open()
+        self._metadata = {
+            'title': metadata.title,
+            'author': metadata.author,
+            'subject': metadata.subject,
+            'keywords': metadata.keywords,
+            'creator': metadata.creator,
+        }
+
+    def add_page(self, image_bytes: bytes, x: float, y: float, width: int, height: int) -> None:
+        """エンコード済み画像を1ページとして書き込む"""
+        page_width, page_height = self._page_size
+        page = self._doc.new_page(width=page_width, height=page_height)
+
+        # PDF座標系（左下原点）からfitzの座標系（左上原点）に変換する
+        rect = fitz.Rect(x, page_height - y - height, x + width, page_height - y)
+        page.insert_image(rect, stream=image_bytes)
+
+    def save(self) -> None:
+        """PDFを保存する"""
+        self._doc.set_metadata(self._metadata)
+        data = self._doc.tobytes(deflate=True)
+        self._doc.close()
+        Path(self._output_path).write_bytes(data)
 
 class ImageToPDF:
+    # 既知の画像形式のマジックバイト
+    _MAGIC_BYTES = (
+        b'\xFF\xD8\xFF',        # JPEG
+        b'\x89PNG\r\n\x1a\n',   # PNG
+        b'GIF87a',              # GIF
+        b'GIF89a',
+        b'BM',                  # BMP
+        b'II*\x00',             # TIFF (リトルエンディアン)
+        b'MM\x00*',             # TIFF (ビッグエンディアン)
+    )
+
+    # このサイズ以上のファイルはmmapで読み込む
+    _MMAP_THRESHOLD = 1024 * 1024
+
     def __init__(self):
         self.supported_formats = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif']
         self._quality = 95
@@ -72,18 +213,278 @@ class ImageToPDF:
         self._metadata = value
 
     def _validate_image(self, image_path: str) -> bool:
-        """画像ファイルの検証を行う"""
+        """画像ファイルの検証を行う
+
+        マジックバイトの確認のみで判定し、コンテナ全体の再パースを避ける。
+        未知の形式のみPILによる完全検証にフォールバックする。
+        """
         if not os.path.exists(image_path):
             raise ImageError(f"ファイルが見つかりません: {image_path}")
-        
+
+        try:
+            with open(image_path, 'rb') as f:
+                head = f.read(32)
+        except (IOError, OSError) as e:
+            raise ImageError(f"無効な画像ファイルです: {image_path}") from e
+
+        if head.startswith(self._MAGIC_BYTES):
+            return True
+
+        # 未知のマジックバイトの場合のみ完全検証
         try:
             with Image.open(image_path) as img:
                 img.verify()
         except Exception as e:
             raise ImageError(f"無効な画像ファイルです: {image_path}") from e
-        
+
         return True
 
+    def _decode_batch(
+        self,
+        image_paths: List[str],
+        target_wh: Tuple[int, int]
+    ) -> Optional[List[Image.Image]]:
+        """画像をまとめてデコードする
+
+        tensorimageが利用可能な場合、デコードとリサイズを
+        スレッドプール上で一括実行する（GILを解放するため高速）。
+        利用できない場合はNoneを返し、呼び出し側がPILで処理する。
+
+        Args:
+            image_paths: 入力画像のパスのリスト
+            target_wh: ターゲットサイズ (width, height)
+
+        Returns:
+            Optional[List[Image.Image]]: デコード済み画像のリスト（フォールバック時はNone）
+        """
+        if tensorimage is None:
+            return None
+
+        try:
+            arrays = tensorimage.load_batch(
+                image_paths,
+                size=int(max(target_wh))
+            )
+            return [Image.fromarray(arr) for arr in arrays]
+        except Exception:
+            # バッチデコードに失敗した場合はPILにフォールバック
+            return None
+
+    def _encode_image(self, image: Image.Image) -> bytes:
+        """画像を一度だけエンコードしてバイト列にする
+
+        JPEGバイト列を事前に作っておくことで、PDFバックエンドが
+        保存時に再エンコードするのを回避する。
+        アルファチャンネルを持つ画像は透過を保持するためPNGのままにする。
+
+        Args:
+            image: エンコードする画像
+
+        Returns:
+            bytes: エンコード済みの画像バイト列
+        """
+        buf = io.BytesIO()
+        if image.mode in ('RGBA', 'LA', 'PA'):
+            image.save(buf, format='PNG')
+        else:
+            if image.mode not in ('RGB', 'L'):
+                image = image.convert('RGB')
+            image.save(
+                buf,
+                format='JPEG',
+                quality=self._quality,
+                optimize=False,
+                progressive=False
+            )
+        return buf.getvalue()
+
+    def _make_page_writer(
+        self,
+        output_path: str,
+        page_size: Tuple[float, float]
+    ) -> Union[_ReportlabWriter, _FitzWriter]:
+        """ページ書き込みバックエンドを選択する
+
+        環境変数 MKPDF_BACKEND=fitz が設定されていてPyMuPDFが
+        インストールされていればfitzバックエンドを使う。
+
+        Args:
+            output_path: 出力PDFのパス
+            page_size: ページサイズ (width, height)
+
+        Returns:
+            選択されたページ書き込みバックエンド
+        """
+        if os.environ.get('MKPDF_BACKEND') == 'fitz' and fitz is not None:
+            return _FitzWriter(output_path, page_size, self.metadata)
+        return _ReportlabWriter(output_path, page_size, self.metadata)
+
+    def _prepare_image(
+        self,
+        image_path: str,
+        page_size: Tuple[float, float],
+        rotate: int,
+        resize: bool
+    ) -> Tuple[bytes, int, int]:
+        """画像ファイルをページに埋め込める状態まで準備する
+
+        開く → draft → 回転 → リサイズ → エンコード を各一度だけ行う
+        正規経路。単一変換と複数変換の両方がここを通るため、
+        再デコードや再エンコードは発生しない。
+
+        Args:
+            image_path: 入力画像のパス
+            page_size: ページサイズ (width, height)
+            rotate: 回転角度（0, 90, 180, 270）
+            resize: 画像をページサイズに合わせてリサイズするかどうか
+
+        Returns:
+            Tuple[bytes, int, int]: エンコード済みバイト列と描画サイズ
+        """
+        # 回転もリサイズも不要なベースラインJPEGはデコードせず、
+        # ファイルのバイト列をそのまま埋め込む（PDFのDCTDecodeフィルタが
+        # 生のJPEGストリームを保持できるため、デコードも再エンコードも不要）
+        if rotate == 0 and not resize and \
+                image_path.lower().endswith(('.jpg', '.jpeg')):
+            try:
+                with Image.open(image_path) as probe:
+                    # ヘッダのみの読み取りでサイズと形式を確認する
+                    passthrough = (
+                        probe.format == 'JPEG'
+                        and probe.mode in ('RGB', 'L')
+                        and 'progression' not in probe.info
+                    )
+                    width, height = probe.size
+                if passthrough:
+                    with open(image_path, 'rb') as f:
+                        return f.read(), width, height
+            except (IOError, OSError):
+                # 通常経路で開き直し、そこでエラーを報告させる
+                pass
+
+        # JPEGはlibjpeg-turboで直接デコードする（PyTurboJPEGがある場合）
+        if _turbojpeg is not None and image_path.lower().endswith(('.jpg', '.jpeg')):
+            try:
+                with open(image_path, 'rb') as f:
+                    jpeg_bytes = f.read()
+                rgb = _turbojpeg.decode(jpeg_bytes, pixel_format=TJPF_RGB)
+                height, width = rgb.shape[:2]
+                image = Image.frombuffer(
+                    'RGB', (width, height), rgb, 'raw', 'RGB', 0, 1
+                )
+                return self._prepare_opened(image, page_size, rotate, resize)
+            except Exception:
+                # デコードに失敗した場合はPILの経路にフォールバック
+                pass
+
+        try:
+            if os.path.getsize(image_path) >= self._MMAP_THRESHOLD:
+                # 大きなファイルはmmapで開き、ページキャッシュから直接
+                # デコードする（bytesへのコピーを1回分省き、常駐メモリも減る）
+                with open(image_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    image = Image.open(mm)
+                    self._draft_jpeg(image, page_size, rotate, resize)
+                    # mmapを閉じる前に全デコードを済ませる
+                    image.load()
+            else:
+                image = Image.open(image_path)
+                self._draft_jpeg(image, page_size, rotate, resize)
+                image.load()
+        except (IOError, OSError, ValueError) as e:
+            raise ImageError(f"画像の読み込みに失敗しました: {e}")
+
+        # GC任せにせず、エンコードが終わった時点でデコードバッファを解放する
+        with image:
+            return self._prepare_opened(image, page_size, rotate, resize)
+
+    def _draft_jpeg(
+        self,
+        image: Image.Image,
+        page_size: Tuple[float, float],
+        rotate: int,
+        resize: bool
+    ) -> None:
+        """JPEGのデコード段階でIDCTダウンスケール（1/2, 1/4, 1/8）を行う
+
+        全画素デコードしてから縮小する無駄を省く。draftは要求サイズ以上に
+        なる最小の縮小率を選ぶため、仕上げのLANCZOSはほぼターゲットサイズの
+        入力に対して走る。
+        """
+        if image.format == 'JPEG' and resize:
+            target_w = int(page_size[0]) * 2
+            target_h = int(page_size[1]) * 2
+            if rotate in (90, 270):
+                # 回転後にページへ収めるので、draftのターゲットも入れ替える
+                target_w, target_h = target_h, target_w
+            image.draft('RGB', (target_w, target_h))
+
+    def _prepare_opened(
+        self,
+        image: Image.Image,
+        page_size: Tuple[float, float],
+        rotate: int,
+        resize: bool
+    ) -> Tuple[bytes, int, int]:
+        """デコード済み画像の回転・リサイズ・エンコードを行う"""
+        # 回転（90度単位なのでtransposeで行う）
+        if rotate in _TRANSPOSE_OPS:
+            image = image.transpose(_TRANSPOSE_OPS[rotate])
+
+        # 画像サイズの計算とリサイズ
+        if resize:
+            width, height = self._get_image_size(image, page_size)
+            image = self._resize_image(image, (width, height))
+        else:
+            width, height = image.size
+
+        # アルファチャンネル付きは白背景に合成してからエンコードする
+        if image.mode in ('RGBA', 'LA', 'PA'):
+            image = composite_over_white(image)
+
+        return self._encode_image(image), width, height
+
+    def _resize_image(self, image: Image.Image, size: Tuple[int, int]) -> Image.Image:
+        """画像を指定サイズにリサイズする
+
+        fast_image_resizeが利用可能でRGB画像の場合はRust製のSIMD対応
+        コンボリューションを使い、それ以外はPillowのLANCZOSで行う。
+
+        Args:
+            image: リサイズする画像
+            size: ターゲットサイズ (width, height)
+
+        Returns:
+            Image.Image: リサイズ済みの画像
+        """
+        # 2倍以上の縮小は、先に整数比のreduce（整数演算のボックスフィルタ）で
+        # ターゲット近くまで落とし、残りの端数だけをLANCZOSで仕上げる。
+        # 浮動小数のコンボリューションを小さな入力に対してだけ走らせるため速い
+        width, height = image.size
+        factor = min(width // max(size[0], 1), height // max(size[1], 1))
+        if factor >= 2 and image.mode not in ('P', '1'):
+            image = image.reduce(factor)
+
+        if fir is not None and image.mode == 'RGB':
+            try:
+                width, height = image.size
+                src = fir.Image.from_bytes(
+                    image.tobytes(), width, height, fir.PixelType.U8x3
+                )
+                dst = fir.Image.new(size[0], size[1], fir.PixelType.U8x3)
+                resizer = fir.Resizer(
+                    fir.ResizeAlg.convolution(fir.FilterType.Lanczos3)
+                )
+                resizer.resize(src, dst)
+                return Image.frombuffer(
+                    'RGB', size, dst.to_bytes(), 'raw', 'RGB', 0, 1
+                )
+            except Exception:
+                # バインディング側の失敗はPillowにフォールバック
+                pass
+
+        return image.resize(size, _RESIZE_FILTER)
+
     def _get_image_size(self, image: Image.Image, max_size: Tuple[int, int]) -> Tuple[int, int]:
         """画像サイズを計算する"""
         width, height = image.size
@@ -102,24 +503,14 @@ class ImageToPDF:
         """画像の配置位置を計算する"""
         width, height = image_size
         page_width, page_height = page_size
-        
-        if position == ImagePosition.CENTER:
-            return (page_width - width) / 2, (page_height - height) / 2
-        elif position == ImagePosition.TOP_LEFT:
-            return 0, page_height - height
-        elif position == ImagePosition.TOP_RIGHT:
-            return page_width - width, page_height - height
-        elif position == ImagePosition.BOTTOM_LEFT:
-            return 0, 0
-        elif position == ImagePosition.BOTTOM_RIGHT:
-            return page_width - width, 0
-        else:
-            return (page_width - width) / 2, (page_height - height) / 2
+
+        pos_fn = _POSITION_TABLE.get(position, _POSITION_TABLE[ImagePosition.CENTER])
+        return pos_fn(width, height, page_width, page_height)
 
     def convert_single_image(
         self,
         image_path: str,
-        output_path: str,
+        output_path: Union[str, BinaryIO],
         page_size: Union[PageSize, Tuple[int, int]] = PageSize.A4,
         rotate: int = 0,
         resize: bool = True,
@@ -128,10 +519,10 @@ class ImageToPDF:
     ) -> None:
         """
         単一の画像をPDFに変換する
-        
+
         Args:
             image_path: 入力画像のパス
-            output_path: 出力PDFのパス
+            output_path: 出力PDFのパス、または書き込み可能なバイナリストリーム
             page_size: PDFのページサイズ
             rotate: 回転角度（0, 90, 180, 270）
             resize: 画像をページサイズに合わせてリサイズするかどうか
@@ -148,41 +539,38 @@ class ImageToPDF:
             raise ValidationError(f"無効な品質値です: {quality}")
 
         try:
-            # 出力ディレクトリの存在確認と作成
-            output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                try:
-                    os.makedirs(output_dir)
-                except (OSError, IOError) as e:
-                    raise PDFError(f"出力ディレクトリの作成に失敗しました: {e}")
-
-            # 画像の読み込み
-            try:
-                img = Image.open(image_path)
-            except (IOError, OSError) as e:
-                raise ImageError(f"画像の読み込みに失敗しました: {e}")
-
-            # 画像の回転
-            if rotate != 0:
-                img = img.rotate(rotate, expand=True)
+            # 出力ディレクトリの存在確認と作成（ストリーム出力時は不要）
+            if not hasattr(output_path, 'write'):
+                output_dir = os.path.dirname(output_path)
+                if output_dir and not os.path.exists(output_dir):
+                    try:
+                        os.makedirs(output_dir)
+                    except (OSError, IOError) as e:
+                        raise PDFError(f"出力ディレクトリの作成に失敗しました: {e}")
 
             # ページサイズの取得
             if isinstance(page_size, PageSize):
-                page_width, page_height = page_size.value
+                page_width, page_height = _PAGE_DIMS[page_size]
             else:
                 page_width, page_height = page_size
 
-            # 画像のリサイズ
-            if resize:
-                img_width, img_height = img.size
-                scale = min(page_width / img_width, page_height / img_height)
-                new_width = int(img_width * scale)
-                new_height = int(img_height * scale)
-                img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+            # 画像の品質設定
+            if quality is not None:
+                self.quality = quality
+
+            # 画像の準備（開く→draft→回転→リサイズ→エンコードを各一度だけ）
+            data, img_width, img_height = self._prepare_image(
+                image_path,
+                (page_width, page_height),
+                rotate,
+                resize
+            )
 
             # PDFの作成
+            # 一旦メモリ上に組み立て、保存時に1回の書き込みで出力する
             try:
-                c = canvas.Canvas(output_path, pagesize=(page_width, page_height))
+                pdf_buffer = io.BytesIO()
+                c = canvas.Canvas(pdf_buffer, pagesize=(page_width, page_height))
             except Exception as e:
                 raise PDFError(f"PDFの作成に失敗しました: {e}")
 
@@ -196,32 +584,29 @@ class ImageToPDF:
                     c.setCreator(self.metadata.creator)
 
             # 画像の配置位置の計算
-            img_width, img_height = img.size
-            if position == ImagePosition.CENTER:
-                x = (page_width - img_width) / 2
-                y = (page_height - img_height) / 2
-            elif position == ImagePosition.TOP_LEFT:
-                x = 0
-                y = page_height - img_height
-            elif position == ImagePosition.TOP_RIGHT:
-                x = page_width - img_width
-                y = page_height - img_height
-            elif position == ImagePosition.BOTTOM_LEFT:
-                x = 0
-                y = 0
-            elif position == ImagePosition.BOTTOM_RIGHT:
-                x = page_width - img_width
-                y = 0
+            x, y = self._calculate_position(
+                (img_width, img_height),
+                (page_width, page_height),
+                position
+            )
 
             # 画像の配置
+            # デコード・リサイズ・エンコード済みのバイト列をそのまま埋め込む
+            # （パスを渡すとreportlabがファイルを再デコードしてしまう）
             try:
-                c.drawImage(image_path, x, y, width=img_width, height=img_height)
+                reader = ImageReader(io.BytesIO(data))
+                c.drawImage(reader, x, y, width=img_width, height=img_height,
+                            mask='auto')
             except Exception as e:
                 raise PDFError(f"画像の配置に失敗しました: {e}")
 
             # PDFの保存
             try:
                 c.save()
+                if hasattr(output_path, 'write'):
+                    output_path.write(pdf_buffer.getvalue())
+                else:
+                    Path(output_path).write_bytes(pdf_buffer.getvalue())
             except Exception as e:
                 raise PDFError(f"PDFの保存に失敗しました: {e}")
 
@@ -262,50 +647,67 @@ class ImageToPDF:
             raise ValidationError(f"無効な品質値です: {quality}")
         
         if isinstance(page_size, PageSize):
-            page_size = page_size.value
-            
-        # PDFの作成
-        c = canvas.Canvas(output_path, pagesize=page_size)
-        
-        # メタデータの設定
-        c.setTitle(self.metadata.title)
-        c.setAuthor(self.metadata.author)
-        c.setSubject(self.metadata.subject)
-        c.setKeywords(self.metadata.keywords)
-        c.setCreator(self.metadata.creator)
-        
+            page_size = _PAGE_DIMS[page_size]
+
+        # 画像の品質設定
+        if quality is not None:
+            self.quality = quality
+
+        # キャンバス作成前に全パスをまとめて検証する
         for image_path in image_paths:
             self._validate_image(image_path)
-            
-            # 画像を開く
-            image = Image.open(image_path)
-            
-            # 回転
-            if rotate in [90, 180, 270]:
-                image = image.rotate(rotate, expand=True)
-            
-            # 画像サイズの計算
-            if resize:
-                width, height = self._get_image_size(image, page_size)
-            else:
-                width, height = image.size
-            
-            # 画像の配置位置を計算
-            x, y = self._calculate_position((width, height), page_size, position)
-            
-            # 画像の品質設定
-            if quality is not None:
-                self.quality = quality
-            
-            # 画像をPDFに追加
-            c.drawImage(
-                ImageReader(image),
-                x, y,
-                width=width,
-                height=height,
-                preserveAspectRatio=True,
-                mask='auto'
+
+        # PDFの作成（バックエンドはメタデータ込みで初期化される）
+        writer = self._make_page_writer(output_path, page_size)
+
+        # 可能であれば一括デコード（tensorimageが無い場合はNone）
+        # バッチデコーダはページサイズに向けて縮小しながら読むため、
+        # 原寸埋め込み（resize=False）や回転によるターゲットの入れ替えを
+        # 表現できない。それらの場合はPIL経路に任せて出力を変えない
+        decoded_images = None
+        if resize and rotate == 0:
+            decoded_images = self._decode_batch(image_paths, page_size)
+
+        def _prep(index: int) -> Tuple[bytes, int, int]:
+            """デコード・回転・リサイズ・エンコードをワーカースレッドで行う"""
+            # バッチデコード済みならそれを使い、無ければ単一変換と同じ経路で開く
+            if decoded_images is not None:
+                return self._prepare_opened(
+                    decoded_images[index], page_size, rotate, resize
+                )
+            return self._prepare_image(
+                image_paths[index], page_size, rotate, resize
             )
-            c.showPage()
-        
-        c.save() 
\ No newline at end of file
+
+        # 配置位置の計算関数をループの外で一度だけ引く
+        pos_fn = _POSITION_TABLE.get(position, _POSITION_TABLE[ImagePosition.CENTER])
+        page_width, page_height = page_size
+
+        # デコード・リサイズ（ワーカースレッド）とページ書き込み（メインスレッド）を
+        # オーバーラップさせる。PILのC拡張はGILを解放するため並列に動く。
+        # Executor.mapのchunksizeはThreadPoolExecutorでは無視されるため、
+        # インデックスを自前でブロックに分けてブロック単位で投入し、
+        # future生成のオーバーヘッドを償却する
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(image_paths) // (4 * workers))
+        blocks = [
+            range(start, min(start + chunksize, len(image_paths)))
+            for start in range(0, len(image_paths), chunksize)
+        ]
+
+        def _prep_block(indices: range) -> List[Tuple[bytes, int, int]]:
+            """1ブロック分の画像をまとめて準備する"""
+            return [_prep(index) for index in indices]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor, \
+                create_progress_bar(len(image_paths), "変換中") as pb:
+            for prepared in executor.map(_prep_block, blocks):
+                for data, width, height in prepared:
+                    # 画像の配置位置を計算
+                    x, y = pos_fn(width, height, page_width, page_height)
+
+                    # 画像をPDFに追加
+                    writer.add_page(data, x, y, width, height)
+                    pb.update(1)
+
+        writer.save() 
\ No newline at end of file
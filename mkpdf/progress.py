@@ -13,12 +13,17 @@ class ProgressBar:
             total: 全体の処理数
             desc: プログレスバーの説明
         """
+        # 更新コストを償却するため、リフレッシュ間隔と更新単位を
+        # 全体の処理数に応じて間引く
         self.pbar = tqdm(
             total=total,
             desc=desc,
             unit="ファイル",
             ncols=80,
-            file=sys.stdout
+            file=sys.stdout,
+            mininterval=0.25,
+            miniters=max(1, total // 200),
+            leave=False
         )
     
     def update(self, n: int = 1) -> None:
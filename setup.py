@@ -31,6 +31,14 @@ setup(
         "click>=8.0.0",
         "tqdm>=4.65.0",
     ],
+    extras_require={
+        "fast": [
+            "tensorimage",
+            "numba",
+            "PyMuPDF",
+            "PyTurboJPEG",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "pdfforge=mkpdf.cli:main",
@@ -1,17 +1,48 @@
+import functools
+import io
+import multiprocessing
+import os
 from pathlib import Path
 from PIL import Image
 
+@functools.lru_cache(maxsize=32)
+def _encode(size: tuple, color: str, suffix: str) -> bytes:
+    """(サイズ, 色, 拡張子) ごとに一度だけ画像をエンコードする
+
+    同じ組み合わせで繰り返し呼ばれるため、エンコード済みバイト列を
+    キャッシュしてファイル書き込みだけを毎回行う。
+
+    Args:
+        size: 画像サイズ (width, height)
+        color: 画像の色
+        suffix: 拡張子（'.jpg' など）
+
+    Returns:
+        bytes: エンコード済みの画像バイト列
+    """
+    img = Image.new('RGB', size, color=color)
+    fmt = Image.registered_extensions()[suffix]
+    buf = io.BytesIO()
+    if fmt == 'JPEG':
+        # Huffman最適化（2パス）で小さく読みやすいファイルを作る。
+        # エンコードは1回だけ（キャッシュされる）なのに対し、各ファイルは
+        # テストとコンバータで複数回デコードされるため差し引きで速くなる
+        img.save(buf, format=fmt, quality=95, optimize=True,
+                 progressive=False, subsampling=2)
+    else:
+        img.save(buf, format=fmt)
+    return buf.getvalue()
+
 def create_test_image(path: Path, size: tuple = (100, 100), color: str = 'red') -> None:
     """
     テスト用の画像ファイルを作成する
-    
+
     Args:
         path: 画像ファイルのパス
         size: 画像サイズ (width, height)
         color: 画像の色
     """
-    img = Image.new('RGB', size, color=color)
-    img.save(path)
+    path.write_bytes(_encode(tuple(size), color, path.suffix.lower()))
 
 def create_test_images(directory: Path, count: int = 3) -> list[Path]:
     """
@@ -26,10 +57,48 @@ def create_test_images(directory: Path, count: int = 3) -> list[Path]:
     """
     directory.mkdir(exist_ok=True)
     image_paths = []
-    
+
+    # 内容は全ファイル同一なのでキャッシュ済みバイト列の書き込みだけで済む
     for i in range(count):
         path = directory / f'test_{i}.jpg'
         create_test_image(path)
         image_paths.append(path)
-    
-    return image_paths
\ No newline at end of file
+
+    return image_paths
+
+def _create_filtered_one(job: tuple) -> None:
+    """フィルター適用画像を1枚作成する（プール用ワーカー）"""
+    path, image_filter = job
+    img = Image.new('RGB', (100, 100), color='white')
+    filtered = img.filter(image_filter)
+    filtered.save(path)
+
+def create_filtered_images(directory: Path, count: int, filters: list) -> list[Path]:
+    """
+    フィルターを適用した複数のテスト用画像ファイルを作成する
+
+    画像ごとにフィルター適用とJPEGエンコードが必要なため、
+    枚数が多い場合はプロセスプールで並列に作成する。
+
+    Args:
+        directory: 画像ファイルを保存するディレクトリ
+        count: 作成する画像ファイルの数
+        filters: 順番に適用するフィルターのリスト
+
+    Returns:
+        list[Path]: 作成した画像ファイルのパスのリスト
+    """
+    directory.mkdir(exist_ok=True)
+    jobs = [
+        (directory / f'batch_{i}.jpg', filters[i % len(filters)])
+        for i in range(count)
+    ]
+
+    if count >= 8:
+        with multiprocessing.Pool(min(count, os.cpu_count() or 1)) as pool:
+            pool.map(_create_filtered_one, jobs)
+    else:
+        for job in jobs:
+            _create_filtered_one(job)
+
+    return [path for path, _ in jobs]
\ No newline at end of file